@@ -125,12 +125,12 @@ class IndexerBatch:
                 self.skipped_offsets.add(partition_offset)
                 continue
 
-            parsed_strings = {
-                metric_name,
-                *tags.keys(),
-                *tags.values(),
-            }
-            org_strings[org_id].update(parsed_strings)
+            # Add to the org's set directly rather than building a temporary
+            # set for every message.
+            strings = org_strings[org_id]
+            strings.add(metric_name)
+            strings.update(tags.keys())
+            strings.update(tags.values())
 
         string_count = 0
         for org_set in org_strings:
@@ -1,6 +1,7 @@
+from collections import defaultdict
 from functools import reduce
 from operator import or_
-from typing import Any, Mapping, Optional, Set
+from typing import Any, List, Mapping, MutableMapping, Optional, Set, Tuple
 
 from django.conf import settings
 from django.db.models import Q
@@ -8,6 +9,7 @@ from django.db.models import Q
 from sentry.sentry_metrics.configuration import UseCaseKey, get_ingest_config
 from sentry.sentry_metrics.indexer.base import (
     FetchType,
+    FetchTypeExt,
     KeyCollection,
     KeyResult,
     KeyResults,
@@ -88,15 +90,29 @@ class PGStringIndexerV2(StringIndexer):
             filtered_db_write_keys = writes_limiter_state.accepted_keys
             del db_write_keys
 
-            rate_limited_key_results = KeyResults()
-            for dropped_string in writes_limiter_state.dropped_strings:
-                rate_limited_key_results.add_key_result(
-                    dropped_string.key_result,
-                    fetch_type=dropped_string.fetch_type,
-                    fetch_type_ext=dropped_string.fetch_type_ext,
-                )
+            # Only build (and later merge) rate limited results when
+            # something was actually dropped, which is the uncommon case.
+            rate_limited_key_results: Optional[KeyResults] = None
+            if writes_limiter_state.dropped_strings:
+                # Dropped strings share one of a few fetch types, so add
+                # them with one add_key_results call per fetch type.
+                dropped_key_results: MutableMapping[
+                    Tuple[FetchType, FetchTypeExt], List[KeyResult]
+                ] = defaultdict(list)
+                for dropped_string in writes_limiter_state.dropped_strings:
+                    dropped_key_results[
+                        (dropped_string.fetch_type, dropped_string.fetch_type_ext)
+                    ].append(dropped_string.key_result)
+
+                rate_limited_key_results = KeyResults()
+                for (fetch_type, fetch_type_ext), results in dropped_key_results.items():
+                    rate_limited_key_results.add_key_results(
+                        results, fetch_type=fetch_type, fetch_type_ext=fetch_type_ext
+                    )
 
             if filtered_db_write_keys.size == 0:
+                if rate_limited_key_results is None:
+                    return db_read_key_results
                 return db_read_key_results.merge(rate_limited_key_results)
 
             new_records = []
@@ -121,7 +137,11 @@ class PGStringIndexerV2(StringIndexer):
             fetch_type=FetchType.FIRST_SEEN,
         )
 
-        return db_read_key_results.merge(db_write_key_results).merge(rate_limited_key_results)
+        key_results = db_read_key_results.merge(db_write_key_results)
+        if rate_limited_key_results is not None:
+            key_results = key_results.merge(rate_limited_key_results)
+
+        return key_results
 
     def record(self, use_case_id: UseCaseKey, org_id: int, string: str) -> Optional[int]:
         """Store a string and return the integer ID generated for it"""
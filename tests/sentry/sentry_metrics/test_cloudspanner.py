@@ -1,7 +1,14 @@
+from unittest.mock import patch
+
 import pytest
 
-from sentry.sentry_metrics.indexer.cloudspanner.cloudspanner import CloudSpannerIndexer, IdCodec
-from sentry.sentry_metrics.indexer.id_generator import get_id
+from sentry.sentry_metrics.configuration import UseCaseKey
+from sentry.sentry_metrics.indexer.cloudspanner.cloudspanner import (
+    CloudSpannerIndexer,
+    IdCodec,
+    RawCloudSpannerIndexer,
+)
+from sentry.sentry_metrics.indexer.id_generator import get_id, reverse_bits
 
 
 @pytest.mark.parametrize(
@@ -21,6 +28,7 @@ def test_id_codec(value) -> None:
     assert encoded <= 9223372036854775807
 
     assert value == codec.decode(encoded)
+    assert encoded == reverse_bits(value, 64) - 2**63
 
 
 @pytest.mark.skip(reason="TODO: Implement it correctly")
@@ -28,3 +36,13 @@ def test_spanner_indexer_service():
     # TODO: Provide instance_id and database_id when running the test
     span_indexer = CloudSpannerIndexer(instance_id="", database_id="")
     span_indexer.validate()
+
+
+@patch("sentry.sentry_metrics.indexer.cloudspanner.cloudspanner.spanner.Client")
+def test_lookups_not_implemented(client) -> None:
+    indexer = RawCloudSpannerIndexer(instance_id="", database_id="")
+
+    with pytest.raises(NotImplementedError):
+        indexer.resolve(UseCaseKey.RELEASE_HEALTH, 1, "a")
+    with pytest.raises(NotImplementedError):
+        indexer.reverse_resolve(UseCaseKey.RELEASE_HEALTH, 1, get_id())